@@ -0,0 +1,27 @@
+'''Getter helpers shared by config and datawriter.'''
+
+from operator import attrgetter, itemgetter
+
+
+def _tuple_getter(getter_type, keys):
+    # Like getter_type(*keys), but always returns a tuple, even for fewer than
+    # two keys.
+    if len(keys) > 1:
+        return getter_type(*keys)
+    elif keys:
+        getter = getter_type(keys[0])
+        return lambda obj: (getter(obj),)
+    else:
+        return lambda obj: ()
+
+
+def tuple_attrgetter(names):
+    '''Get a function returning a tuple of the ``names`` attributes of its
+    argument.'''
+    return _tuple_getter(attrgetter, names)
+
+
+def tuple_itemgetter(keys):
+    '''Get a function returning a tuple of the ``keys`` items of its
+    argument.'''
+    return _tuple_getter(itemgetter, keys)
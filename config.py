@@ -120,6 +120,20 @@ Config classes provide the following methods automatically:
         other than :const:`NO_DEFAULT` before ``__init__()`` exits, otherwise
         ``ConfigMeta.__call__()`` will raise a :exc:`ValueError`.
 
+.. note::
+
+    Config field values are stored in ``__slots__`` generated by
+    :class:`ConfigMeta`, so config objects have no per-instance ``__dict__``. If
+    a config class needs additional non-field instance attributes (e.g. ones
+    assigned in a custom ``__init__()``), declare them in the class' own
+    ``__slots__``, which will be extended with the config fields.
+
+    Config objects can still be weak-referenced. However, because each config
+    class lays out its own field slots, a class cannot inherit from two config
+    classes that both define fields (e.g. ``class D(A, C)``); Python raises
+    ``TypeError: multiple bases have instance lay-out conflict``. Other mixin
+    classes of a config class should declare empty ``__slots__``.
+
 .. note::
 
     The special behavior described for the types and objects in this module
@@ -130,9 +144,11 @@ Config classes provide the following methods automatically:
 
 '''
 
-from collections import OrderedDict
+import sys
 from types import FunctionType
 
+from ._getters import tuple_attrgetter
+
 
 class field:
     '''Force wrapped item to become a config field.'''
@@ -194,15 +210,23 @@ already finished initializing raises a :exc:`ValueError`.
 
 class _ConfigMethodsMixin:
     # Mixin class for bestowing default methods on config classes.
+    __slots__ = ()
+
     def __init__(self, config=None, **kwargs):
         if config is not None:
-            self.update(**config.to_dict())
+            if type(config) is type(self):
+                # Values from a config of the same class have already been
+                # validated and cast, so copy them directly.
+                for name, value in zip(self._field_names, self._field_attrgetter(config)):
+                    object.__setattr__(self, name, value)
+            else:
+                self.update(**config.to_dict())
         self.update(**kwargs)
 
     def update(self, **kwargs):
         '''Assign config fields from keyword arguments.'''
         for name, value in kwargs.items():
-            if name in self._fields:
+            if name in self._field_set:
                 setattr(self, name, value)
             else:
                 raise AttributeError(
@@ -211,9 +235,7 @@ class _ConfigMethodsMixin:
 
     def to_dict(self):
         '''Return a dictionary of this object's config fields.'''
-        return {
-            name: getattr(self, name) for name in self._fields
-        }
+        return dict(zip(self._field_names, self._field_attrgetter(self)))
 
     def keys(self):
         '''Get an iterator over the names of this object's config fields.
@@ -221,7 +243,7 @@ class _ConfigMethodsMixin:
         Analogous to :meth:`dict.keys()`.
 
         '''
-        return self._fields.keys()
+        return iter(self._field_names)
 
     def values(self):
         '''Get an iterator over the current values of this object's config
@@ -230,7 +252,7 @@ class _ConfigMethodsMixin:
         Analogous to :meth:`dict.values()`.
 
         '''
-        return (getattr(self, name) for name in self.keys())
+        return iter(self._field_attrgetter(self))
 
     def items(self):
         '''Get an iterator over name-value pairs for this object's config fields.
@@ -239,14 +261,14 @@ class _ConfigMethodsMixin:
 
         '''
         # Becomes items() method of new config class.
-        return zip(self.keys(), self.values())
+        return zip(self._field_names, self.values())
 
     @classmethod
     def defaults(cls):
         '''Get an iterator over name-default pairs for this object's config
         fields.'''
         # Becomes defaults() method of new config class.
-        return ((name, obj.default) for name, obj in cls._fields.items())
+        return iter(cls._field_defaults)
 
     @classmethod
     def default(cls, name):
@@ -257,75 +279,126 @@ class _ConfigMethodsMixin:
         return self.keys()
 
     def __getitem__(self, key):
-        if key in self._fields:
+        if key in self._field_set:
             return getattr(self, key)
         else:
             raise KeyError(key)
 
     def __setitem__(self, key, value):
-        if key in self._fields:
+        if key in self._field_set:
             return setattr(self, key, value)
         else:
             raise KeyError(key)
 
     def __setattr__(self, key, value):
-        if key in self._fields:
-            if value is NO_DEFAULT and not self._default_init:
+        if key in self._field_set:
+            if value is NO_DEFAULT:
                 raise ValueError(
                     f"Attempt to assign NO_DEFAULT to field {repr(key)} after end of "
                     f"{self.__class__.__name__} object initialization"
                 )
 
-            field_ = self._fields[key]
-            if (
-                    isinstance(field_, typed_field)
-                    and (value is not None or not field_.allow_none)
-                    and value is not NO_DEFAULT
-            ):
-                value = field_.type_(value)
+            # NO_DEFAULT was rejected above, so it never needs to be excluded
+            # from casting here.
+            cast = self._typed_casts.get(key)
+            if cast is not None and (value is not None or not cast[1]):
+                value = cast[0](value)
 
         object.__setattr__(self, key, value)
 
     def __eq__(self, other):
         if isinstance(other, type(self)) or isinstance(self, type(other)):
-            return all(
-                self[field] == other[field]
-                for field in self._fields.keys()
-            )
+            get_values = self._field_attrgetter
+            return get_values(self) == get_values(other)
 
     def __repr__(self):
         return "<{}: {{{}}}>".format(
             self.__class__.__name__,
             ", ".join(
-                f"{name}: {repr(getattr(self, name))}"
-                for name in self._fields
+                f"{name}: {repr(value)}"
+                for name, value in zip(self._field_names, self._field_attrgetter(self))
             )
         )
 
 
+def _make_init_defaults(clsname, fields):
+    # Generate a function assigning each field its default, as straight-line
+    # code with typed_field casts inlined. Values are stored with
+    # object.__setattr__(), bypassing _ConfigMethodsMixin.__setattr__(), which
+    # would otherwise reject NO_DEFAULT.
+    namespace = {'_setattr': object.__setattr__}
+    lines = ['def _init_defaults(self):']
+    for i, (name, field_) in enumerate(fields.items()):
+        namespace[f'_default{i}'] = field_.default
+        value = f'_default{i}'
+        if (
+                isinstance(field_, typed_field)
+                and (field_.default is not None or not field_.allow_none)
+                and field_.default is not NO_DEFAULT
+        ):
+            namespace[f'_type{i}'] = field_.type_
+            value = f'_type{i}({value})'
+        lines.append(f'    _setattr(self, {repr(name)}, {value})')
+    if not fields:
+        lines.append('    pass')
+
+    exec(compile('\n'.join(lines), f'<config {clsname}>', 'exec'), namespace)
+    return namespace['_init_defaults']
+
+
 class ConfigMeta(type):
     '''Config class metaclass. See module-level documentation for details.'''
     def __new__(cls, clsname, bases, clsdict):
         # Set up _fields listing valid config fields and their default
-        # values.
-        field_names = [
-            name for name, value in clsdict.items()
-            if not name.startswith('_')
-            and not isinstance(value, nonfield)
-            and not isinstance(value, FunctionType)
-        ]
-        clsdict['_fields'] = OrderedDict()
-        for name in field_names:
-            obj = clsdict.pop(name)
-            if isinstance(obj, field):
-                clsdict['_fields'][name] = obj
-            else:
-                clsdict['_fields'][name] = field(obj)
-
-        # Resolve nonfield class attrs.
-        for name in clsdict:
-            if isinstance(clsdict[name], nonfield):
-                clsdict[name] = clsdict[name].value
+        # values, and resolve nonfield class attrs, in one pass over clsdict.
+        fields = []
+        nonfields = []
+        for name, value in clsdict.items():
+            if isinstance(value, nonfield):
+                nonfields.append((name, value.value))
+            elif not name.startswith('_') and not isinstance(value, FunctionType):
+                fields.append((name, value if isinstance(value, field) else field(value)))
+        for name, _ in fields:
+            del clsdict[name]
+        clsdict.update(nonfields)
+
+        # Interned names make lookups of names computed at runtime (e.g. by
+        # config file loaders) hit the identity fast path.
+        clsdict['_fields'] = {sys.intern(name): field_ for name, field_ in fields}
+
+        # Cache per-class views of _fields for the per-instance methods.
+        clsdict['_field_names'] = tuple(clsdict['_fields'])
+        clsdict['_field_set'] = frozenset(clsdict['_fields'])
+        clsdict['_field_defaults'] = tuple(
+            (name, field_.default) for name, field_ in clsdict['_fields'].items()
+        )
+        clsdict['_no_default_names'] = tuple(
+            name for name, default in clsdict['_field_defaults']
+            if default is NO_DEFAULT
+        )
+        clsdict['_field_attrgetter'] = staticmethod(
+            tuple_attrgetter(clsdict['_field_names'])
+        )
+        clsdict['_typed_casts'] = {
+            name: (field_.type_, field_.allow_none)
+            for name, field_ in clsdict['_fields'].items()
+            if isinstance(field_, typed_field)
+        }
+        clsdict['_init_defaults'] = _make_init_defaults(clsname, clsdict['_fields'])
+
+        # Store field values in slots rather than a per-instance __dict__. Any
+        # __slots__ declared by the class body are kept alongside the fields.
+        slots = clsdict.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        slots = tuple(slots) + clsdict['_field_names']
+        # Keep config objects weak-referenceable, adding the slot only once per
+        # hierarchy.
+        if '__weakref__' not in slots and not any(
+                base.__weakrefoffset__ for base in bases
+        ):
+            slots += ('__weakref__',)
+        clsdict['__slots__'] = slots
 
         obj = super().__new__(cls, clsname, bases + (_ConfigMethodsMixin,), clsdict)
         return obj
@@ -333,21 +406,19 @@ class ConfigMeta(type):
     def __call__(cls, *args, **kwargs):
         obj = cls.__new__(cls, *args, **kwargs)
 
-        obj._default_init = True
-        for name, field_ in cls._fields.items():
-            setattr(obj, name, field_.default)
-        obj._default_init = False
+        obj._init_defaults()
 
         obj.__init__(*args, **kwargs)
 
-        unset_no_default = [
-            name for name in cls._fields
-            if getattr(obj, name) is NO_DEFAULT
-        ]
-        if unset_no_default:
-            raise ValueError(
-                "Unset NO_DEFAULT fields {}".format(", ".join(unset_no_default))
-            )
+        if cls._no_default_names:
+            unset_no_default = [
+                name for name in cls._no_default_names
+                if getattr(obj, name) is NO_DEFAULT
+            ]
+            if unset_no_default:
+                raise ValueError(
+                    "Unset NO_DEFAULT fields {}".format(", ".join(unset_no_default))
+                )
 
         return obj
 
@@ -356,4 +427,5 @@ class Config(metaclass=ConfigMeta):
     '''Convinence class with :class:`ConfigMeta` as its metaclass, to allow
     creating config classes by inheritance. See module-level documentation for
     details.'''
-    pass
+    __slots__ = ()
+
@@ -4,6 +4,11 @@ import csv
 import logging
 from pathlib import Path
 
+from ._getters import tuple_itemgetter
+
+
+_log = logging.getLogger(__name__)
+
 
 class DataWriter:
     '''TODO'''
@@ -17,50 +22,117 @@ class DataWriter:
             exist_ok=False,
     ):
         '''TODO'''
-        logging.debug(
-            f"\n  path={repr(path)} ({Path(path).absolute()})"
-            f"\n  ivars={repr(ivars)}"
-            f"\n  dvars={repr(dvars)}"
-            f"\n  parents={repr(parents)}"
-            f"\n  exist_ok={repr(exist_ok)}"
-        )
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                f"\n  path={repr(path)} ({Path(path).absolute()})"
+                f"\n  ivars={repr(ivars)}"
+                f"\n  dvars={repr(dvars)}"
+                f"\n  parents={repr(parents)}"
+                f"\n  exist_ok={repr(exist_ok)}"
+            )
 
         self.path = Path(path)
         self.ivars = tuple(ivars)
         self.dvars = tuple(dvars)
+        self._get_vars = tuple_itemgetter(self.ivars + self.dvars)
 
         if self.path.is_dir():
             raise FileExistsError(f"{self.path.absolute()} is a directory")
 
         elif self.path.is_file():
             if exist_ok:
-                logging.info(f"appending to {self.path.absolute()}")
-                with open(self.path, 'r') as f:
-                    self.completed = set(
-                        tuple(row[var] for var in self.ivars)
-                        for row in csv.DictReader(f)
-                    )
+                _log.info("appending to %s", self.path.absolute())
+                with open(self.path, 'r', newline='') as f:
+                    # Only the ivar columns are needed, so read plain rows and
+                    # pick those columns out by index. Like csv.DictReader,
+                    # skip blank rows and fill missing trailing values with
+                    # None.
+                    reader = csv.reader(f)
+                    header = next(reader, None)
+                    if header is None:
+                        self.completed = set()
+                    else:
+                        width = len(header)
+                        missing = [var for var in self.ivars if var not in header]
+                        if missing:
+                            raise ValueError(
+                                f"{self.path.absolute()} has no column for "
+                                f"ivars {', '.join(map(repr, missing))}"
+                            )
+                        get_ivars = tuple_itemgetter(
+                            [header.index(var) for var in self.ivars]
+                        )
+                        self.completed = {
+                            get_ivars(
+                                row if len(row) >= width
+                                else row + [None] * (width - len(row))
+                            )
+                            for row in filter(None, reader)
+                        }
             else:
                 raise FileExistsError(f"{self.path.absolute()} exists")
+            self._file = open(self.path, 'a', newline='', buffering=1)
+            self._writer = csv.DictWriter(self._file, self.ivars + self.dvars)
 
         else:
-            logging.info(f"creating {repr(self.path)}")
-            with open(self.path, 'w') as f:
-                csv.DictWriter(f, self.ivars + self.dvars).writeheader()
+            _log.info("creating %r", self.path)
+            self._file = open(self.path, 'w', newline='', buffering=1)
+            self._writer = csv.DictWriter(self._file, self.ivars + self.dvars)
+            self._writer.writeheader()
             self.completed = set()
 
-        logging.debug(f"self.completed={sorted(self.completed)}")
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(f"self.completed={sorted(self.completed)}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def write(self, rowdict):
         '''TODO'''
+        # Look up every var before writing, so that a row missing one raises
+        # KeyError without reaching the file.
+        values = self._get_vars(rowdict)
+        if _log.isEnabledFor(logging.DEBUG):
+            self._log_row(values)
+        self._writer.writerow(rowdict)
+
+        self.completed.add(values[:len(self.ivars)])
+
+    def write_many(self, rowdicts):
+        '''Write each row in the iterable ``rowdicts``, as if by :meth:`write`.
+
+        Rows are handed to the underlying :class:`csv.DictWriter` as one batch,
+        which is cheaper than calling :meth:`write` for each row. If any row is
+        missing a var, :exc:`KeyError` is raised and no rows are written.
+
+        '''
+        rowdicts = list(rowdicts)
+        rows_values = list(map(self._get_vars, rowdicts))
+        if _log.isEnabledFor(logging.DEBUG):
+            for values in rows_values:
+                self._log_row(values)
+        self._writer.writerows(rowdicts)
+
+        n_ivars = len(self.ivars)
+        self.completed.update(values[:n_ivars] for values in rows_values)
+
+    def _log_row(self, values):
         varnames = self.ivars + self.dvars
-        logging.debug("{{\n{}\n}}".format(
+        _log.debug("{{\n{}\n}}".format(
             "\n  ".join(
-                f"{repr(varname)}: {repr(rowdict[varname])}"
-                for varname in varnames
+                f"{repr(varname)}: {repr(value)}"
+                for varname, value in zip(varnames, values)
             )
         ))
-        with open(self.path, 'a') as f:
-            csv.DictWriter(f, varnames).writerow(rowdict)
 
-        self.completed.add(tuple(rowdict[var] for var in self.ivars))
+    def close(self):
+        '''Close the output file.
+
+        The file is kept open (line-buffered) between calls to :meth:`write`, so
+        call this when done writing, or use the writer as a context manager.
+
+        '''
+        self._file.close()
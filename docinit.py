@@ -4,11 +4,15 @@
 
 
 import argparse
+from collections import deque
+from contextlib import contextmanager
+import os
 from pathlib import Path
 import re
 import shutil
 import subprocess as subp
 import sys
+import tempfile
 
 
 EXTENSIONS = '''extensions = [
@@ -72,6 +76,11 @@ sphinx-autoapi
 sphinx-design
 '''
 
+_TITLE_RE = re.compile(r'(.+?) documentation\n')
+_CAPTION_RE = re.compile(r' *:caption: Contents:\n')
+_PROJECT_RE = re.compile(r"project = '(.*?)'\n")
+_COPYRIGHT_RE = re.compile(r"copyright = '([0-9]+?), (.+?)'\n")
+
 
 parser = argparse.ArgumentParser()
 parser.add_argument(
@@ -83,6 +92,26 @@ parser.add_argument(
 )
 
 
+@contextmanager
+def _rewrite(path):
+    # Yield (in_file, out_file), where out_file is a temporary file in the same
+    # directory that replaces path once the context exits without error.
+    with (
+            open(path) as in_file,
+            tempfile.NamedTemporaryFile(
+                'w', dir=path.parent, prefix=f'.{path.name}.', delete=False,
+            ) as out_file,
+    ):
+        try:
+            yield in_file, out_file
+        except BaseException:
+            out_file.close()
+            os.remove(out_file.name)
+            raise
+    shutil.copymode(path, out_file.name)
+    os.replace(out_file.name, path)
+
+
 def _main(argv):
     if '--' in argv:
         split_idx = argv.index('--')
@@ -97,12 +126,10 @@ def _main(argv):
     subp.run(['sphinx-quickstart', args.dir, '--no-sep'] + sphinx_argv)
 
     ## index.rst ##
-    with open(args.dir / 'index.rst') as index_file:
-        index_lines = list(index_file.readlines())
-    with open(args.dir / 'index.rst', 'w') as index_file:
-        for line in index_lines:
+    with _rewrite(args.dir / 'index.rst') as (old_index_file, index_file):
+        for line in old_index_file:
             # Remove trailing documentation from title.
-            match = re.fullmatch(r'(.+?) documentation\n', line)
+            match = _TITLE_RE.fullmatch(line)
             if match:
                 line = f"{match.group(1)}\n"
 
@@ -111,46 +138,43 @@ def _main(argv):
                     line.startswith("Add your content")
                     or line.startswith("`reStructuredText ")
                     or line.startswith("documentation for details.")
-                    or re.fullmatch(r' *:caption: Contents:\n', line)
+                    or _CAPTION_RE.fullmatch(line)
             ):
                 line = ""
 
             index_file.write(line)
 
     ## conf.py ##
-    write_on_delay = []
-    with open(args.dir / 'conf.py') as conf_file:
-        conf_lines = list(conf_file.readlines())
-    with open(args.dir / 'conf.py', 'w') as conf_file:
-        for line in conf_lines:
-            delay_written = set()
-            for i in range(len(write_on_delay)):
-                write_on_delay[i][0] -= 1
-                if write_on_delay[i][0] == 0:
-                    conf_file.write(write_on_delay[i][1])
-                    delay_written.add(i)
-                for i in delay_written:
-                    write_on_delay.pop(i)
+    write_on_delay = deque()  # (lines remaining, text) pairs
+    with _rewrite(args.dir / 'conf.py') as (old_conf_file, conf_file):
+        for line in old_conf_file:
+            # Count down pending writes, writing any that are due.
+            for _ in range(len(write_on_delay)):
+                delay, text = write_on_delay.popleft()
+                if delay > 1:
+                    write_on_delay.append((delay - 1, text))
+                else:
+                    conf_file.write(text)
 
             # Save project title.
-            match = re.fullmatch(r"project = '(.*?)'\n", line)
+            match = _PROJECT_RE.fullmatch(line)
             if match:
                 project_title = match.group(1)
 
             # Fix copyright info.
-            match = re.fullmatch(r"copyright = '([0-9]+?), (.+?)'\n", line)
+            match = _COPYRIGHT_RE.fullmatch(line)
             if match:
                 year, author = match.groups()
                 line = f"copyright = 'CC BY 4.0, {year}, {author}'\n"
 
             # Add top-level project dir to path.
             if line.startswith("# -- General configuration --"):
-                write_on_delay.append([
+                write_on_delay.append((
                     3,
                     "from pathlib import Path\n"
                     "import sys\n"
                     "sys.path.insert(0, str(Path(__file__).parent.parent))\n\n",
-                ])
+                ))
 
             # Add extensions.
             if line == "extensions = []\n":
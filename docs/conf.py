@@ -3,8 +3,7 @@
 # For the full list of built-in configuration values, see the documentation:
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
 
-from pathlib import Path
-import sys
+import os
 
 # -- Project information -----------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#project-information
@@ -16,8 +15,6 @@ author = 'lunaria'
 # -- General configuration ---------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 extensions = [
     'autoapi.extension',
     'sphinx_design',
@@ -27,10 +24,20 @@ extensions = [
 
 # autoapi.extension
 autoapi_type = 'python'
+# The repository root is the package itself, so it can't be narrowed further.
+# Instead, the directory patterns below (no trailing /*) let autoapi prune
+# non-source directories from its walk rather than visiting every file in them.
 autoapi_dirs = ['..']
 autoapi_ignore = [
+    '*/.*',
     '*/.*/*',
+    '*/docs',
     '*/docs/*',
+    '*/resources',
+    '*/resources/*',
+    '*/tests',
+    '*/tests/*',
+    '*/__pycache__',
     '*/__pycache__/*',
 ]
 autoapi_add_toctree_entry = False
@@ -39,22 +46,28 @@ autoapi_template_dir = './_templates/autoapi/'
 autoapi_python_class_content = 'both'
 autoapi_options =  [
     'members',
-    'inherited-members',
     'undoc-members',
-    'show-inheritance',
     'show-module-summary',
     'imported-members',
 ]
+# Walking class hierarchies for these is a large part of the build time, so
+# they're only enabled for full builds (DOCS_FULL=1).
+if os.environ.get('DOCS_FULL') == '1':
+    autoapi_options += [
+        'inherited-members',
+        'show-inheritance',
+    ]
 
 # sphinx.ext.intersphinx
 intersphinx_mapping = {
     'huggingface_hub': ('https://huggingface.co/docs/huggingface_hub/master/en/', None),
+    'numpy': ('https://numpy.org/doc/stable/', None),
     'python': ('https://docs.python.org/3/', None),
     'transformers': ('https://huggingface.co/docs/transformers/master/en/', None),
 }
 
 templates_path = ['_templates']
-exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
+exclude_patterns = ['_build', '.doctrees-cache', 'Thumbs.db', '.DS_Store']
 
 
 
@@ -0,0 +1,27 @@
+'''Tests for mypyutils.
+
+The repository root is the ``mypyutils`` package itself, so a checkout is not
+importable as ``mypyutils`` unless its directory happens to have that name.
+The package is registered under that name here, before any test module is
+imported, so that the tests run from the repository root with either::
+
+    $ python -m unittest discover -s tests -t .
+    $ python -m pytest tests
+
+'''
+
+import importlib.util
+from pathlib import Path
+import sys
+
+
+if 'mypyutils' not in sys.modules:
+    _root = Path(__file__).parent.parent
+    _spec = importlib.util.spec_from_file_location(
+        'mypyutils',
+        _root / '__init__.py',
+        submodule_search_locations=[str(_root)],
+    )
+    _module = importlib.util.module_from_spec(_spec)
+    sys.modules['mypyutils'] = _module
+    _spec.loader.exec_module(_module)
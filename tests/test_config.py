@@ -0,0 +1,73 @@
+import unittest
+import weakref
+
+from mypyutils.config import Config, NO_DEFAULT, field, nonfield, typed_field
+
+
+class TestConfigFields(unittest.TestCase):
+    class ExampleConfig(Config):
+        plain = "plain"
+        _private = "private"
+        forced = field(None)
+        excluded = nonfield("excluded")
+        typed = typed_field(1, str)
+        non_null = typed_field(None, str, allow_none=False)
+        required = NO_DEFAULT
+
+        def method(self):
+            return self.plain
+
+    def test_field_names(self):
+        self.assertEqual(
+            list(self.ExampleConfig(required=0).keys()),
+            ['plain', 'forced', 'typed', 'non_null', 'required'],
+        )
+
+    def test_nonfields_resolved(self):
+        config = self.ExampleConfig(required=0)
+        self.assertEqual(config.excluded, "excluded")
+        self.assertEqual(config._private, "private")
+        self.assertEqual(config.method(), "plain")
+
+    def test_typed_fields_cast(self):
+        config = self.ExampleConfig(required=0)
+        self.assertEqual(config.typed, "1")
+        self.assertEqual(config.non_null, "None")
+        config.typed = 2
+        self.assertEqual(config.typed, "2")
+        config.typed = None
+        self.assertIsNone(config.typed)
+
+    def test_no_default(self):
+        with self.assertRaises(ValueError):
+            self.ExampleConfig()
+        config = self.ExampleConfig(required=0)
+        with self.assertRaises(ValueError):
+            config.required = NO_DEFAULT
+
+    def test_unknown_field(self):
+        with self.assertRaises(AttributeError):
+            self.ExampleConfig(required=0, unknown=0)
+        with self.assertRaises(KeyError):
+            self.ExampleConfig(required=0)['unknown']
+
+    def test_copy_from_config(self):
+        config = self.ExampleConfig(plain="changed", required=0)
+        self.assertEqual(self.ExampleConfig(config), config)
+        self.assertNotEqual(self.ExampleConfig(config, typed=5), config)
+
+    def test_no_instance_dict(self):
+        config = self.ExampleConfig(required=0)
+        self.assertFalse(hasattr(config, '__dict__'))
+        with self.assertRaises(AttributeError):
+            config.not_a_field = 0
+
+    def test_weakref(self):
+        config = self.ExampleConfig(required=0)
+        self.assertIs(weakref.ref(config)(), config)
+
+        class Subconfig(self.ExampleConfig):
+            extra = 0
+
+        subconfig = Subconfig()
+        self.assertIs(weakref.ref(subconfig)(), subconfig)
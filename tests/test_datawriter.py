@@ -0,0 +1,62 @@
+from pathlib import Path
+import tempfile
+import unittest
+
+from mypyutils.datawriter import DataWriter
+
+
+class TestDataWriterResume(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = Path(tmpdir.name) / 'data.csv'
+
+    def open_existing(self, text):
+        self.path.write_text(text)
+        writer = DataWriter(self.path, ['a'], ['b'], exist_ok=True)
+        self.addCleanup(writer.close)
+        return writer
+
+    def test_completed(self):
+        writer = self.open_existing('a,b\n1,2\n3,4\n')
+        self.assertEqual(writer.completed, {('1',), ('3',)})
+
+    def test_blank_rows_skipped(self):
+        writer = self.open_existing('a,b\n1,2\n\n')
+        self.assertEqual(writer.completed, {('1',)})
+
+    def test_short_rows_filled(self):
+        self.path.write_text('a,b\n1,2\n3\n')
+        writer = DataWriter(self.path, ['b'], exist_ok=True)
+        self.addCleanup(writer.close)
+        self.assertEqual(writer.completed, {('2',), (None,)})
+
+    def test_missing_ivar_column(self):
+        for text in ('a,b\n', 'a,b\n1,2\n'):
+            self.path.write_text(text)
+            with self.assertRaisesRegex(ValueError, "'c'"):
+                DataWriter(self.path, ['c'], exist_ok=True)
+
+
+class TestDataWriterWrite(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = Path(tmpdir.name) / 'data.csv'
+        self.writer = DataWriter(self.path, ['a'], ['b'])
+        self.addCleanup(self.writer.close)
+
+    def test_write(self):
+        self.writer.write({'a': 1, 'b': 2})
+        self.writer.write_many([{'a': 3, 'b': 4}, {'a': 5, 'b': 6}])
+        self.assertEqual(self.writer.completed, {(1,), (3,), (5,)})
+        self.assertEqual(self.path.read_text(), 'a,b\n1,2\n3,4\n5,6\n')
+
+    def test_missing_var_not_written(self):
+        for rowdict in ({'b': 1}, {'a': 2}):
+            with self.assertRaises(KeyError):
+                self.writer.write(rowdict)
+        with self.assertRaises(KeyError):
+            self.writer.write_many([{'a': 1, 'b': 2}, {'a': 3}])
+        self.assertEqual(self.writer.completed, set())
+        self.assertEqual(self.path.read_text(), 'a,b\n')
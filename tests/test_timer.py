@@ -0,0 +1,204 @@
+from array import array
+import asyncio
+from itertools import count
+import time
+import unittest
+from unittest import mock
+
+from mypyutils.timer import Timer
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _clock(step=1):
+    # Fake clock advancing by step on every call.
+    return count(0, step).__next__
+
+
+class TestTimer(unittest.TestCase):
+    def test_default_clocks(self):
+        self.assertIs(Timer().timefn, time.perf_counter)
+        self.assertIs(Timer.cpu().timefn, time.process_time)
+        self.assertEqual(Timer().times.typecode, 'd')
+
+    def test_time(self):
+        timer = Timer(_clock())
+        with timer.time():
+            pass
+        with timer.time():
+            pass
+        self.assertEqual(timer.times, array('d', [1, 1]))
+
+    def test_nested(self):
+        timer = Timer(_clock())
+        with timer.time():
+            with timer.time():
+                pass
+        self.assertEqual(timer.times, array('d', [1, 3]))
+
+    def test_reenter_active_context(self):
+        timer = Timer(_clock())
+        context = timer.time()
+        with context:
+            with self.assertRaises(RuntimeError):
+                with context:
+                    pass
+        # Once exited, the context may be entered again.
+        with context:
+            pass
+        self.assertEqual(len(timer.times), 2)
+
+    def test_context_has_no_dict(self):
+        timer = Timer()
+        self.assertFalse(hasattr(timer.time(), '__dict__'))
+        self.assertFalse(hasattr(timer.atime(), '__dict__'))
+
+    def test_decorator(self):
+        timer = Timer(_clock())
+
+        @timer.time
+        def bare(x):
+            '''Bare docstring.'''
+            return x
+
+        @timer.time()
+        def called(x):
+            return x
+
+        self.assertEqual(bare(1), 1)
+        self.assertEqual(called(2), 2)
+        self.assertEqual(bare.__name__, 'bare')
+        self.assertEqual(bare.__doc__, 'Bare docstring.')
+        self.assertEqual(timer.times, array('d', [1, 1]))
+
+    def test_decorator_shared_context(self):
+        timer = Timer(_clock())
+        context = timer.time()
+        f = context(lambda: 'f')
+        g = context(lambda: 'g')
+        self.assertEqual((f(), g()), ('f', 'g'))
+        self.assertEqual(len(timer.times), 2)
+
+    def test_decorator_recursion(self):
+        timer = Timer(_clock())
+
+        @timer.time
+        def countdown(n):
+            return n if n == 0 else countdown(n - 1)
+
+        self.assertEqual(countdown(3), 0)
+        self.assertEqual(timer.times, array('d', [1, 3, 5, 7]))
+
+    def test_atime(self):
+        timer = Timer(_clock())
+
+        async def measure():
+            async with timer.atime():
+                await asyncio.sleep(0)
+
+        asyncio.run(measure())
+        self.assertEqual(timer.times, array('d', [1]))
+
+    def test_atime_decorator(self):
+        timer = Timer(_clock())
+
+        @timer.atime
+        async def bare(x):
+            return x
+
+        @timer.atime()
+        async def called(x):
+            return x
+
+        self.assertEqual(asyncio.run(bare(1)), 1)
+        self.assertEqual(asyncio.run(called(2)), 2)
+        self.assertEqual(bare.__name__, 'bare')
+        self.assertEqual(timer.times, array('d', [1, 1]))
+
+    def test_ns(self):
+        for timefn, timefn_ns in Timer.NS_TIMERS.items():
+            self.assertIs(Timer(timefn, ns=True).timefn, timefn_ns)
+
+        clock = _clock(1500)
+        timer = Timer(clock, ns=True)
+        self.assertIs(timer.timefn, clock)
+        with timer.time():
+            pass
+        self.assertEqual(timer.times, array('q', [1500]))
+        self.assertEqual(timer.times_seconds, array('d', [1.5e-6]))
+
+    def test_capacity(self):
+        timer = Timer(_clock(), capacity=3)
+        self.assertEqual(timer.times, array('d', [0, 0, 0]))
+        with timer.time_into(1):
+            pass
+        self.assertEqual(timer.times, array('d', [0, 1, 0]))
+
+        timer = Timer(_clock(), capacity=2, ns=True)
+        self.assertEqual(timer.times, array('q', [0, 0]))
+
+    def test_time_many(self):
+        calls = []
+        timer = Timer(_clock())
+        timer.time_many(4)(calls.append, 'x')
+        self.assertEqual(calls, ['x'] * 4)
+        self.assertEqual(timer.times, array('d', [0.25]))
+
+        timer = Timer(_clock(1000), ns=True)
+        timer.time_many(3)(lambda: None)
+        self.assertEqual(timer.times, array('q', [333]))
+
+    def test_invalid_n(self):
+        timer = Timer()
+        for n in (0, -1):
+            with self.assertRaises(ValueError):
+                timer.time_many(n)
+            with self.assertRaises(ValueError):
+                timer.clock_overhead(n)
+
+    def test_clock_overhead(self):
+        self.assertEqual(Timer(_clock()).clock_overhead(10), 1)
+
+
+@unittest.skipUnless(numpy, "requires NumPy")
+class TestTimerNumpy(unittest.TestCase):
+    def test_as_numpy(self):
+        timer = Timer()
+        timer.times.extend([1.0, 2.0])
+        view = timer.as_numpy()
+        self.assertEqual(view.tolist(), [1.0, 2.0])
+        timer.times[0] = 3.0
+        self.assertEqual(view[0], 3.0)
+
+    def test_stats(self):
+        timer = Timer()
+        timer.times.extend([1.0, 2.0, 3.0, 4.0])
+        stats = timer.stats()
+        self.assertEqual(stats['n'], 4)
+        self.assertEqual(stats['mean'], 2.5)
+        self.assertEqual(stats['p50'], 2.5)
+        self.assertEqual(stats['min'], 1.0)
+        self.assertEqual(stats['max'], 4.0)
+
+    def test_stats_empty(self):
+        with self.assertRaises(ValueError):
+            Timer().stats()
+
+    def test_stats_allows_concurrent_measurements(self):
+        # Stands in for a thread recording a measurement while a reduction has
+        # released the GIL.
+        timer = Timer()
+        timer.times.extend([1.0, 2.0])
+        quantile = numpy.quantile
+
+        def quantile_and_record(*args, **kwargs):
+            with timer.time():
+                pass
+            return quantile(*args, **kwargs)
+
+        with mock.patch.object(numpy, 'quantile', quantile_and_record):
+            self.assertEqual(timer.stats()['n'], 2)
+        self.assertEqual(len(timer.times), 3)
@@ -1,27 +1,266 @@
 '''Code timing utilities.'''
 
-from contextlib import contextmanager
+from array import array
+from functools import partial, wraps
+from itertools import repeat
 import time
 
 
+class _TimerContext:
+    # Context manager returned by Timer.time() and Timer.time_into(). A plain
+    # class with __enter__()/__exit__() is cheaper to enter and exit than a
+    # contextlib.contextmanager generator. Measured times are passed to record.
+    #
+    # Each context holds the start time of a single measurement, so entering one
+    # that is already active would clobber its start time. That raises instead.
+    # When used as a decorator, each call gets a fresh context from
+    # _recreate_cm(), so decorated functions may recurse or run in parallel.
+    # This mirrors contextlib.ContextDecorator, which is not inherited because
+    # it has no __slots__ and would give every context a __dict__.
+    __slots__ = ('_timefn', '_record', '_start')
+
+    def __init__(self, timefn, record):
+        self._timefn = timefn
+        self._record = record
+        self._start = None
+
+    def __enter__(self):
+        if self._start is not None:
+            raise RuntimeError(
+                "Timer context is already active; use a new context from the "
+                "Timer for each measurement"
+            )
+        self._start = self._timefn()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        end = self._timefn()
+        self._record(end - self._start)
+        self._start = None
+        return False
+
+    def __call__(self, fn):
+        @wraps(fn)
+        def inner(*args, **kwargs):
+            with self._recreate_cm():
+                return fn(*args, **kwargs)
+        return inner
+
+    def _recreate_cm(self):
+        return type(self)(self._timefn, self._record)
+
+
+class _AsyncTimerContext(_TimerContext):
+    # Asynchronous context manager returned by Timer.atime().
+    __slots__ = ()
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return self.__exit__(exc_type, exc_value, traceback)
+
+    def __call__(self, fn):
+        @wraps(fn)
+        async def inner(*args, **kwargs):
+            async with self._recreate_cm():
+                return await fn(*args, **kwargs)
+        return inner
+
+
 class Timer:
-    '''Class providing a context manager for measuring code execution time.'''
+    '''Class providing a context manager for measuring code execution time.
+
+    By default, time is measured with :func:`time.perf_counter`, a
+    high-resolution monotonic clock that includes time spent sleeping or waiting
+    on I/O. Use :meth:`cpu` to measure only the CPU time of the current process
+    instead.
+
+    With ``ns=True``, times are measured and stored as integer nanoseconds
+    (:pep:`564`), avoiding the precision lost by subtracting float seconds.
+    ``timefn`` is replaced by its nanosecond variant from :attr:`NS_TIMERS`;
+    other functions are used as given, and must then return integer
+    nanoseconds.
+
+    Every call to :meth:`time` or :meth:`time_into` returns a new context
+    holding its own start time, so measurements may be nested, and may run
+    concurrently in multiple threads (e.g. tasks in a
+    :class:`~concurrent.futures.ThreadPoolExecutor`) sharing one timer, without
+    locking. Each measurement is saved with a single :class:`array.array`
+    operation, which the GIL makes atomic.
+
+    '''
+
+    NS_TIMERS = {
+        time.monotonic: time.monotonic_ns,
+        time.perf_counter: time.perf_counter_ns,
+        time.process_time: time.process_time_ns,
+        time.thread_time: time.thread_time_ns,
+        time.time: time.time_ns,
+    }
+    '''Nanosecond variants of :mod:`time` clock functions, used when a timer is
+    created with ``ns=True``.'''
+
+    def __init__(self, timefn=time.perf_counter, capacity=None, ns=False):
+        if ns:
+            timefn = self.NS_TIMERS.get(timefn, timefn)
 
-    def __init__(self, timefn=time.process_time):
         self.timefn = timefn
         '''Function that will be used to measure the start and end times of the
         managed context.'''
 
-        self.times = []
+        self.times = array('q' if ns else 'd')
         '''Measured time of each managed context, in order of when each context
-        ended.'''
+        ended.
+
+        Stored as an :class:`array.array` of C doubles (or 64-bit integers,
+        with ``ns=True``), rather than a list of Python objects, for
+        compactness.
+
+        If the timer was created with a ``capacity``, this starts out as
+        ``capacity`` zeros, to be filled in by :meth:`time_into`.
+
+        '''
+        if capacity is not None:
+            self.times = array(self.times.typecode, bytes(self.times.itemsize * capacity))
+
+    @property
+    def times_seconds(self):
+        '''Copy of ``times`` as an :class:`array.array` of doubles, converted to
+        seconds if the timer measures nanoseconds.'''
+        if self.times.typecode == 'q':
+            return array('d', (t / 1_000_000_000 for t in self.times))
+        else:
+            return array('d', self.times)
+
+    @classmethod
+    def cpu(cls, **kwargs):
+        '''Get a timer that measures CPU time with :func:`time.process_time`.
+
+        CPU time excludes time spent sleeping or waiting on I/O, and includes
+        time spent in all threads of the current process. ``kwargs`` are passed
+        to the constructor.
+
+        '''
+        return cls(time.process_time, **kwargs)
 
-    @contextmanager
-    def time(self):
+    def as_numpy(self):
+        '''Get a :class:`numpy.ndarray` view of ``times``, without copying.
+
+        Requires NumPy. The view shares memory with ``times``, so ``times``
+        cannot grow while the view exists.
+
+        '''
+        import numpy as np
+        return np.frombuffer(self.times, dtype=self.times.typecode)
+
+    def clock_overhead(self, n=1000):
+        '''Estimate the time between two back-to-back calls to :attr:`timefn`.
+
+        This is the overhead included in every measurement, which may be
+        subtracted from the entries of ``times`` when timing very short
+        contexts. The estimate is the mean over ``n`` pairs of calls, so ``n``
+        must be at least 1.
+
+        '''
+        if n < 1:
+            raise ValueError(f"clock_overhead() needs n >= 1, got {n!r}")
+
+        timefn = self.timefn
+        total = 0
+        for _ in range(n):
+            start = timefn()
+            total += timefn() - start
+        return total / n
+
+    def stats(self):
+        '''Summarize ``times`` with NumPy's vectorized reductions.
+
+        Returns a dict with the number of measurements (``n``) and their
+        ``mean``, standard deviation (``std``), median (``p50``), 95th
+        percentile (``p95``), ``min``, and ``max``, in the same units as
+        ``times``. Requires NumPy.
+
+        The reductions run on a snapshot of ``times``, rather than the view from
+        :meth:`as_numpy`, so other threads may keep recording measurements
+        meanwhile.
+
+        '''
+        import numpy as np
+        a = np.frombuffer(self.times.tobytes(), dtype=self.times.typecode)
+        if not a.size:
+            raise ValueError("Timer has no measurements to summarize")
+        p50, p95 = np.quantile(a, (0.5, 0.95))
+        return {
+            'n': a.size,
+            'mean': a.mean(),
+            'std': a.std(),
+            'p50': p50,
+            'p95': p95,
+            'min': a.min(),
+            'max': a.max(),
+        }
+
+    def time(self, fn=None):
         '''Context manager that will measure execution time of the managed
-        context, then save that time to ``times``.'''
-        start = self.timefn()
-        try:
-            yield
-        finally:
-            self.times.append(self.timefn() - start)
+        context, then save that time to ``times``.
+
+        This can also be used as a decorator, either as ``@timer.time`` or
+        ``@timer.time()``, to time every call to the decorated function. A single
+        context may decorate several functions.
+
+        '''
+        context = _TimerContext(self.timefn, self.times.append)
+        return context if fn is None else context(fn)
+
+    def atime(self, fn=None):
+        '''Asynchronous context manager that will measure execution time of the
+        managed context, then save that time to ``times``.
+
+        Use as ``async with timer.atime():``. Like :meth:`time`, this can also
+        decorate coroutine functions, as ``@timer.atime`` or
+        ``@timer.atime()``. The measured time includes time
+        spent awaiting, so it is usually only meaningful with a wall clock such
+        as the default :func:`time.perf_counter`; a CPU clock like
+        :func:`time.process_time` would miss time spent waiting on I/O.
+
+        '''
+        context = _AsyncTimerContext(self.timefn, self.times.append)
+        return context if fn is None else context(fn)
+
+    def time_many(self, n):
+        '''Get a function that calls a function ``n`` times under a single
+        measurement, then saves the mean time per call to ``times``.
+
+        For example, ``timer.time_many(1000)(fn, *args, **kwargs)`` records the
+        mean time of ``fn(*args, **kwargs)`` over 1000 calls. Like
+        :mod:`timeit`, this spreads the cost of starting and stopping the clock
+        over many calls, for timing operations too fast to measure one at a
+        time. ``n`` must be at least 1.
+
+        '''
+        if n < 1:
+            raise ValueError(f"time_many() needs n >= 1, got {n!r}")
+
+        def run(fn, *args, **kwargs):
+            timefn = self.timefn
+            start = timefn()
+            for _ in repeat(None, n):
+                fn(*args, **kwargs)
+            elapsed = timefn() - start
+            if self.times.typecode == 'q':
+                self.times.append(round(elapsed / n))
+            else:
+                self.times.append(elapsed / n)
+
+        return run
+
+    def time_into(self, i):
+        '''Context manager that will measure execution time of the managed
+        context, then save that time to ``times[i]``.
+
+        Meant for timers created with a ``capacity``, so that ``times`` never
+        has to grow while measuring.
+
+        '''
+        return _TimerContext(self.timefn, partial(self.times.__setitem__, i))